@@ -1,11 +1,12 @@
 """Agent identity and configuration management."""
 
-import os
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from .fsutil import atomic_write
+from .yamlutil import loader, scalar
 
 
 @dataclass
@@ -14,34 +15,45 @@ class AgentConfig:
     name: str
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def config_dir(cls) -> Path:
         """Get the gaston config directory."""
         return Path.home() / ".gaston"
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def config_path(cls) -> Path:
         """Get the path to the agent config file."""
         return cls.config_dir() / "config.yaml"
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def load(cls) -> Optional["AgentConfig"]:
-        """Load agent config from disk. Returns None if not configured."""
-        config_path = cls.config_path()
-        if not config_path.exists():
+        """Load agent config from disk. Returns None if not configured.
+
+        The result is memoized for the life of the process; save() clears it.
+        """
+        try:
+            content = cls.config_path().read_bytes()
+        except FileNotFoundError:
             return None
 
-        with open(config_path) as f:
-            data = yaml.safe_load(f)
+        yaml_loader = loader()(content)
+        try:
+            data = yaml_loader.get_single_data()
+        finally:
+            yaml_loader.dispose()
 
         return cls(name=data["name"])
 
     def save(self) -> None:
         """Save agent config to disk."""
-        config_dir = self.config_dir()
-        config_dir.mkdir(parents=True, exist_ok=True)
+        self.config_dir().mkdir(parents=True, exist_ok=True)
+
+        # A single string key doesn't need the full YAML emitter
+        atomic_write(self.config_path(), f"name: {scalar(self.name)}\n".encode("utf-8"))
 
-        with open(self.config_path(), "w") as f:
-            yaml.dump({"name": self.name}, f)
+        AgentConfig.load.cache_clear()
 
     @classmethod
     def require(cls) -> "AgentConfig":
@@ -7,11 +7,14 @@ import click
 
 from .agent import AgentConfig
 from .gitops import (
+    GitBatch,
     GitError,
     branch_exists,
+    commit_file,
     create_branch,
     create_pr,
     fetch,
+    find_pr_for_branch,
     get_current_branch,
     get_default_branch,
     get_repo_root,
@@ -24,12 +27,23 @@ from .gitops import (
     pull,
     push,
     rebase,
-    stage_file,
+    stage_commit_push,
     switch_branch,
-    commit,
 )
 from .registry import Registry, TaskStatus
 
+# Pre-styled "[status]" labels for the tasks listing
+_STATUS_LABELS = {
+    status: click.style(f"[{status.value}]", fg=color)
+    for status, color in {
+        TaskStatus.PENDING: "white",
+        TaskStatus.CLAIMED: "yellow",
+        TaskStatus.IN_PROGRESS: "cyan",
+        TaskStatus.REVIEW: "magenta",
+        TaskStatus.MERGED: "green",
+    }.items()
+}
+
 
 def get_context() -> tuple[Path, Registry]:
     """Get repo root and load registry."""
@@ -39,6 +53,9 @@ def get_context() -> tuple[Path, Registry]:
         click.echo("Error: Not in a git repository.", err=True)
         sys.exit(1)
 
+    # Answer ref lookups for the rest of the command from one git process
+    click.get_current_context().with_resource(GitBatch(repo_root))
+
     try:
         registry = Registry.load(repo_root)
     except FileNotFoundError as e:
@@ -84,28 +101,20 @@ def tasks():
     click.echo("-" * 60)
 
     for task in registry.tasks:
-        status_color = {
-            TaskStatus.PENDING: "white",
-            TaskStatus.CLAIMED: "yellow",
-            TaskStatus.IN_PROGRESS: "cyan",
-            TaskStatus.REVIEW: "magenta",
-            TaskStatus.MERGED: "green",
-        }.get(task.status, "white")
-
-        status_str = click.style(f"[{task.status.value}]", fg=status_color)
-
-        click.echo(f"  {task.id}: {task.description}")
-        click.echo(f"    Status: {status_str}")
-
+        lines = [
+            f"  {task.id}: {task.description}",
+            f"    Status: {_STATUS_LABELS[task.status]}",
+        ]
         if task.claimed_by:
-            click.echo(f"    Claimed by: {task.claimed_by}")
+            lines.append(f"    Claimed by: {task.claimed_by}")
         if task.branch:
-            click.echo(f"    Branch: {task.branch}")
+            lines.append(f"    Branch: {task.branch}")
         if task.depends_on:
-            click.echo(f"    Depends on: {', '.join(task.depends_on)}")
+            lines.append(f"    Depends on: {', '.join(task.depends_on)}")
         if task.files:
-            click.echo(f"    Files: {', '.join(task.files)}")
-        click.echo()
+            lines.append(f"    Files: {', '.join(task.files)}")
+        # Trailing newline leaves a blank line between tasks
+        click.echo("\n".join(lines) + "\n")
 
 
 @cli.command()
@@ -152,18 +161,27 @@ def claim(task_id: str, force: bool):
         click.echo("\nUse --force to claim anyway.", err=True)
         sys.exit(1)
 
-    # Create branch
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Independent git reads; subprocess waits release the GIL
     branch_name = f"agent/{agent.name}/{task_id}"
-    if branch_exists(branch_name, repo_root):
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        exists_future = executor.submit(branch_exists, branch_name, repo_root)
+        default_future = executor.submit(get_default_branch, repo_root)
+        remote_future = executor.submit(has_remote, repo_root)
+    default_branch = default_future.result()
+    remote = remote_future.result()
+
+    # Create branch
+    if exists_future.result():
         click.echo(f"Error: Branch '{branch_name}' already exists.", err=True)
         sys.exit(1)
 
     # Switch to default branch first
-    default_branch = get_default_branch(repo_root)
     switch_branch(default_branch, repo_root)
 
     # Pull latest
-    if has_remote(repo_root):
+    if remote:
         try:
             pull(repo_root)
         except GitError:
@@ -173,14 +191,13 @@ def claim(task_id: str, force: bool):
     create_branch(branch_name, repo_root)
 
     # Update registry
-    task.status = TaskStatus.CLAIMED
+    registry.set_status(task, TaskStatus.CLAIMED)
     task.claimed_by = agent.name
     task.branch = branch_name
 
-    # Save registry, then stage and commit
-    registry.save(repo_root)
-    stage_file("gaston.yaml", repo_root)
-    commit(f"[gaston] Claim task: {task_id}", repo_root)
+    # Save registry, then commit it if anything changed
+    if registry.save(repo_root):
+        commit_file("gaston.yaml", f"[gaston] Claim task: {task_id}", repo_root)
 
     click.echo(f"Claimed task '{task_id}'")
     click.echo(f"Created branch: {branch_name}")
@@ -238,7 +255,7 @@ def sync():
 
     click.echo(f"Fetching latest from remote...")
     if has_remote(repo_root):
-        fetch(repo_root)
+        fetch(repo_root, refspec=default_branch)
 
     click.echo(f"Rebasing {current_branch} onto {default_branch}...")
     try:
@@ -262,8 +279,16 @@ def submit(title: str, body: str):
     agent = AgentConfig.require()
     repo_root, registry = get_context()
 
-    current_branch = get_current_branch(repo_root)
-    default_branch = get_default_branch(repo_root)
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Independent git reads; subprocess waits release the GIL
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        current_future = executor.submit(get_current_branch, repo_root)
+        default_future = executor.submit(get_default_branch, repo_root)
+        remote_future = executor.submit(has_remote, repo_root)
+    current_branch = current_future.result()
+    default_branch = default_future.result()
+    remote = remote_future.result()
 
     if current_branch == default_branch:
         click.echo(f"Error: You're on {default_branch}. Switch to a task branch first.", err=True)
@@ -285,19 +310,26 @@ def submit(title: str, body: str):
         sys.exit(1)
 
     # Check if rebased
-    if has_remote(repo_root):
-        fetch(repo_root)
+    if remote:
+        fetch(repo_root, refspec=default_branch)
         if not is_rebased(f"origin/{default_branch}", repo_root):
             click.echo("Error: Branch is not rebased onto latest main.", err=True)
             click.echo("Run 'gaston sync' first.", err=True)
             sys.exit(1)
 
+    # Record the status change first so a single push carries both the
+    # work and the registry update. Nothing to commit on a re-submit.
+    registry.set_status(task, TaskStatus.REVIEW)
+    if registry.save(repo_root):
+        commit_file("gaston.yaml", f"[gaston] Submit task for review: {task.id}", repo_root)
+
     # Push branch
     click.echo(f"Pushing {current_branch}...")
     try:
         push(current_branch, set_upstream=True, cwd=repo_root)
     except GitError as e:
         click.echo(f"Push failed: {e}", err=True)
+        click.echo("Fix the problem and run 'gaston submit' again.", err=True)
         sys.exit(1)
 
     # Create PR
@@ -319,17 +351,6 @@ Submitted by agent: {agent.name}
     except GitError as e:
         click.echo(f"Failed to create PR: {e}", err=True)
         click.echo("You may need to create the PR manually.", err=True)
-        # Still update registry
-        pass
-
-    # Update task status
-    task.status = TaskStatus.REVIEW
-    registry.save(repo_root)
-
-    # Commit registry update
-    stage_file("gaston.yaml", repo_root)
-    commit(f"[gaston] Submit task for review: {task.id}", repo_root)
-    push(current_branch, cwd=repo_root)
 
     click.echo(f"\nTask '{task.id}' is now awaiting review.")
 
@@ -396,13 +417,11 @@ def approve(task_id: str):
 
     # Try to find and approve the PR
     try:
-        prs = list_prs("open", repo_root)
-        for pr in prs:
-            if pr.branch == task.branch:
-                click.echo(f"Approving PR #{pr.number}...")
-                approve_pr(pr.number, repo_root)
-                click.echo(f"Approved PR #{pr.number}")
-                break
+        pr = find_pr_for_branch(task.branch, repo_root) if task.branch else None
+        if pr is not None:
+            click.echo(f"Approving PR #{pr.number}...")
+            approve_pr(pr.number, repo_root)
+            click.echo(f"Approved PR #{pr.number}")
         else:
             click.echo("No matching PR found. Approval recorded in registry only.")
     except GitError as e:
@@ -434,24 +453,21 @@ def merge_task(task_id: str):
 
     # Try to find and merge the PR
     try:
-        prs = list_prs("open", repo_root)
-        for pr in prs:
-            if pr.branch == task.branch:
-                click.echo(f"Merging PR #{pr.number}...")
-                merge_pr(pr.number, repo_root)
-                click.echo(f"Merged PR #{pr.number}")
-                break
-        else:
+        pr = find_pr_for_branch(task.branch, repo_root) if task.branch else None
+        if pr is None:
             click.echo("No matching PR found on GitHub.", err=True)
             click.echo("You may need to merge manually.", err=True)
             sys.exit(1)
+        click.echo(f"Merging PR #{pr.number}...")
+        merge_pr(pr.number, repo_root)
+        click.echo(f"Merged PR #{pr.number}")
     except GitError as e:
         click.echo(f"Merge failed: {e}", err=True)
         sys.exit(1)
 
     # Update task status
-    task.status = TaskStatus.MERGED
-    registry.save(repo_root)
+    registry.set_status(task, TaskStatus.MERGED)
+    changed = registry.save(repo_root)
 
     # Need to update registry on main branch
     default_branch = get_default_branch(repo_root)
@@ -459,9 +475,13 @@ def merge_task(task_id: str):
     pull(repo_root)
 
     # Registry should be updated - save and commit
-    stage_file("gaston.yaml", repo_root)
-    commit(f"[gaston] Mark task as merged: {task_id}", repo_root)
-    push(default_branch, cwd=repo_root)
+    if changed:
+        stage_commit_push(
+            "gaston.yaml",
+            f"[gaston] Mark task as merged: {task_id}",
+            default_branch,
+            repo_root,
+        )
 
     click.echo(f"\nTask '{task_id}' has been merged!")
 
@@ -491,7 +511,7 @@ def new_task(task_id: str, description: str, files: tuple, depends: tuple):
         depends_on=list(depends),
     )
 
-    registry.tasks.append(task)
+    registry.add_task(task)
     registry.save(repo_root)
 
     click.echo(f"Added task: {task_id}")
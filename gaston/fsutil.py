@@ -0,0 +1,18 @@
+"""Filesystem helpers."""
+
+import os
+from pathlib import Path
+
+
+def atomic_write(path: Path, content: bytes) -> None:
+    """Replace path with content, so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
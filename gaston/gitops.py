@@ -1,6 +1,8 @@
 """Git operations wrapper."""
 
+import functools
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -11,63 +13,160 @@ class GitError(Exception):
     pass
 
 
-def run_git(*args: str, cwd: Optional[Path] = None, check: bool = True) -> str:
-    """Run a git command and return stdout."""
-    result = subprocess.run(
+def _git(*args: str, cwd: Optional[Path] = None) -> subprocess.CompletedProcess:
+    """Run a git command, capturing its output."""
+    return subprocess.run(
         ["git", *args],
         cwd=cwd,
         capture_output=True,
         text=True,
+        # Skips closing every fd in the child. Safe because Python creates
+        # fds non-inheritable by default, so nothing leaks into git.
+        close_fds=False,
     )
 
+
+def run_git(*args: str, cwd: Optional[Path] = None, check: bool = True) -> str:
+    """Run a git command and return stdout."""
+    result = _git(*args, cwd=cwd)
+
     if check and result.returncode != 0:
         raise GitError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
 
     return result.stdout.strip()
 
 
+class GitBatch:
+    """A long-lived `git cat-file --batch-check` process for resolving refs.
+
+    While the context manager is active, branch_exists() and
+    get_default_branch() calls for the same cwd are answered by this process
+    instead of spawning git each time.
+    """
+
+    def __init__(self, cwd: Optional[Path] = None):
+        self.cwd = cwd
+        self._proc: Optional[subprocess.Popen] = None
+        # One request/response at a time over the pipe
+        self._lock = threading.Lock()
+        self._previous: Optional["GitBatch"] = None
+
+    def __enter__(self) -> "GitBatch":
+        global _active_batch
+        self._previous = _active_batch
+        _active_batch = self
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _active_batch
+        _active_batch = self._previous
+        self.close()
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Get the object name ref points to, or None if it doesn't exist."""
+        if "\n" in ref:
+            return None
+
+        with self._lock:
+            if self._proc is None:
+                self._proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+                    cwd=self.cwd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    close_fds=False,
+                )
+
+            self._proc.stdin.write(ref + "\n")
+            self._proc.stdin.flush()
+            line = self._proc.stdout.readline()
+            if not line:
+                self._close()
+                raise GitError(f"git cat-file exited while resolving {ref}")
+
+        # "<sha> <type>" on success, "<ref> missing" / "<ref> ambiguous" otherwise
+        name, _, kind = line.rstrip("\n").rpartition(" ")
+        if kind in ("missing", "ambiguous"):
+            return None
+        return name
+
+    def close(self) -> None:
+        """Stop the git process. It is restarted on the next resolve()."""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._proc is not None:
+            self._proc.stdin.close()
+            self._proc.wait()
+            self._proc.stdout.close()
+            self._proc = None
+
+
+_active_batch: Optional[GitBatch] = None
+
+
+def _resolve(ref: str, cwd: Optional[Path] = None) -> Optional[str]:
+    """Resolve a ref, through the active GitBatch when it covers cwd."""
+    if _active_batch is not None and _active_batch.cwd == cwd:
+        return _active_batch.resolve(ref)
+    try:
+        return run_git("rev-parse", "--verify", ref, cwd=cwd)
+    except GitError:
+        return None
+
+
+def _invalidate_git_cache() -> None:
+    """Forget memoized repository reads after an operation that changes them."""
+    for func in (get_repo_root, get_current_branch, get_default_branch, get_remote_url, has_remote):
+        func.cache_clear()
+    # cat-file may hold on to refs it has already read
+    if _active_batch is not None:
+        _active_batch.close()
+
+
+@functools.lru_cache(maxsize=None)
 def get_repo_root(cwd: Optional[Path] = None) -> Path:
     """Get the root directory of the git repository."""
     root = run_git("rev-parse", "--show-toplevel", cwd=cwd)
     return Path(root)
 
 
+@functools.lru_cache(maxsize=None)
 def get_current_branch(cwd: Optional[Path] = None) -> str:
     """Get the name of the current branch."""
     return run_git("rev-parse", "--abbrev-ref", "HEAD", cwd=cwd)
 
 
+@functools.lru_cache(maxsize=None)
 def get_default_branch(cwd: Optional[Path] = None) -> str:
     """Get the default branch (main or master)."""
-    try:
-        run_git("rev-parse", "--verify", "main", cwd=cwd)
-        return "main"
-    except GitError:
-        return "master"
+    return "main" if _resolve("main", cwd) is not None else "master"
 
 
 def branch_exists(branch: str, cwd: Optional[Path] = None) -> bool:
     """Check if a branch exists."""
-    try:
-        run_git("rev-parse", "--verify", branch, cwd=cwd)
-        return True
-    except GitError:
-        return False
+    return _resolve(branch, cwd) is not None
 
 
 def create_branch(branch: str, cwd: Optional[Path] = None) -> None:
     """Create a new branch and switch to it."""
     run_git("checkout", "-b", branch, cwd=cwd)
+    _invalidate_git_cache()
 
 
 def switch_branch(branch: str, cwd: Optional[Path] = None) -> None:
     """Switch to an existing branch."""
     run_git("checkout", branch, cwd=cwd)
+    _invalidate_git_cache()
 
 
 def commit(message: str, cwd: Optional[Path] = None) -> None:
     """Create a commit with all staged changes."""
     run_git("commit", "-m", message, cwd=cwd)
+    _invalidate_git_cache()
 
 
 def stage_file(path: str, cwd: Optional[Path] = None) -> None:
@@ -75,6 +174,31 @@ def stage_file(path: str, cwd: Optional[Path] = None) -> None:
     run_git("add", path, cwd=cwd)
 
 
+def commit_file(path: str, message: str, cwd: Optional[Path] = None) -> None:
+    """Commit the current contents of a single file.
+
+    Only the given path is committed; other staged changes are left staged.
+    """
+    args = ("commit", "-m", message, "--", path)
+    result = _git(*args, cwd=cwd)
+    if result.returncode != 0:
+        # Untracked files can't be committed by path until they're added;
+        # any other failure (hooks, nothing to commit, ...) is reported as is
+        tracked = _git("ls-files", "--error-unmatch", "--", path, cwd=cwd).returncode == 0
+        if not tracked:
+            stage_file(path, cwd)
+            result = _git(*args, cwd=cwd)
+    if result.returncode != 0:
+        raise GitError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    _invalidate_git_cache()
+
+
+def stage_commit_push(path: str, message: str, branch: str, cwd: Optional[Path] = None) -> None:
+    """Commit a single file and push the branch."""
+    commit_file(path, message, cwd)
+    push(branch, cwd=cwd)
+
+
 def has_changes(cwd: Optional[Path] = None) -> bool:
     """Check if there are uncommitted changes."""
     status = run_git("status", "--porcelain", cwd=cwd)
@@ -90,6 +214,7 @@ def has_staged_changes(cwd: Optional[Path] = None) -> bool:
 def pull(cwd: Optional[Path] = None) -> None:
     """Pull from remote."""
     run_git("pull", cwd=cwd)
+    _invalidate_git_cache()
 
 
 def push(branch: str, set_upstream: bool = False, cwd: Optional[Path] = None) -> None:
@@ -98,25 +223,33 @@ def push(branch: str, set_upstream: bool = False, cwd: Optional[Path] = None) ->
         run_git("push", "-u", "origin", branch, cwd=cwd)
     else:
         run_git("push", cwd=cwd)
+    _invalidate_git_cache()
 
 
 def rebase(base: str, cwd: Optional[Path] = None) -> None:
     """Rebase current branch onto base."""
     run_git("rebase", base, cwd=cwd)
+    _invalidate_git_cache()
 
 
-def fetch(cwd: Optional[Path] = None) -> None:
-    """Fetch from all remotes."""
-    run_git("fetch", "--all", cwd=cwd)
+def fetch(cwd: Optional[Path] = None, refspec: Optional[str] = None) -> None:
+    """Fetch from all remotes, or only refspec from origin if given."""
+    if refspec:
+        run_git("fetch", "origin", refspec, cwd=cwd)
+    else:
+        run_git("fetch", "--all", cwd=cwd)
 
 
 def is_rebased(base: str, cwd: Optional[Path] = None) -> bool:
     """Check if current branch is rebased onto base."""
-    merge_base = run_git("merge-base", "HEAD", base, cwd=cwd)
-    base_commit = run_git("rev-parse", base, cwd=cwd)
-    return merge_base == base_commit
+    # Exit status 0: base is an ancestor of HEAD, 1: it isn't, else an error
+    result = _git("merge-base", "--is-ancestor", base, "HEAD", cwd=cwd)
+    if result.returncode not in (0, 1):
+        raise GitError(f"git merge-base {base} failed: {result.stderr.strip()}")
+    return result.returncode == 0
 
 
+@functools.lru_cache(maxsize=None)
 def get_remote_url(cwd: Optional[Path] = None) -> Optional[str]:
     """Get the remote origin URL."""
     try:
@@ -125,6 +258,7 @@ def get_remote_url(cwd: Optional[Path] = None) -> Optional[str]:
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def has_remote(cwd: Optional[Path] = None) -> bool:
     """Check if a remote is configured."""
     return get_remote_url(cwd) is not None
@@ -165,10 +299,10 @@ def create_pr(title: str, body: str, base: str, cwd: Optional[Path] = None) -> P
     )
 
 
-def list_prs(state: str = "open", cwd: Optional[Path] = None) -> list[PRInfo]:
-    """List pull requests using gh CLI."""
+def _gh_pr_list(*args: str, cwd: Optional[Path] = None) -> list[PRInfo]:
+    """Run gh pr list with the given filters and parse the results."""
     proc = subprocess.run(
-        ["gh", "pr", "list", "--state", state, "--json", "number,title,headRefName,author,url"],
+        ["gh", "pr", "list", *args, "--json", "number,title,headRefName,author,url"],
         cwd=cwd,
         capture_output=True,
         text=True,
@@ -191,6 +325,17 @@ def list_prs(state: str = "open", cwd: Optional[Path] = None) -> list[PRInfo]:
     ]
 
 
+def list_prs(state: str = "open", cwd: Optional[Path] = None) -> list[PRInfo]:
+    """List pull requests using gh CLI."""
+    return _gh_pr_list("--state", state, cwd=cwd)
+
+
+def find_pr_for_branch(branch: str, cwd: Optional[Path] = None) -> Optional[PRInfo]:
+    """Find the open pull request for a head branch using gh CLI."""
+    prs = _gh_pr_list("--state", "open", "--head", branch, "--limit", "1", cwd=cwd)
+    return prs[0] if prs else None
+
+
 def approve_pr(number: int, cwd: Optional[Path] = None) -> None:
     """Approve a pull request using gh CLI."""
     proc = subprocess.run(
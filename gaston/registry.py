@@ -1,11 +1,20 @@
 """Task registry management (gaston.yaml)."""
 
+import functools
+import json
+import os
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from .fsutil import atomic_write
+from .yamlutil import loader, scalar
+
+# Bump whenever the layout of the cached registry data changes so stale
+# caches from an older gaston are ignored.
+_CACHE_VERSION = 4
 
 
 class TaskStatus(str, Enum):
@@ -17,6 +26,36 @@ class TaskStatus(str, Enum):
     MERGED = "merged"
 
 
+# Statuses whose files are considered "owned" for conflict checking
+_ACTIVE_STATUSES = frozenset({TaskStatus.CLAIMED, TaskStatus.IN_PROGRESS, TaskStatus.REVIEW})
+
+# Key under which a file-index node stores the tasks registered at that path.
+# Path components are always strings, so None can never collide with one.
+_OWNERS = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _path_parts(path: str) -> tuple[str, ...]:
+    """Split a registry path into components, ignoring trailing slashes.
+
+    Components are interned so trie lookups compare by identity.
+    """
+    return tuple(sys.intern(part) for part in path.rstrip("/").split("/"))
+
+
+def _write_yaml_list(out: list[str], key: str, values) -> None:
+    """Append a task's list field to out.
+
+    gaston.yaml is hand-edited, so a bare scalar (e.g. ``files: src/``) is
+    written back unchanged rather than split into one item per character.
+    """
+    if isinstance(values, list):
+        out.append(f"  {key}:\n")
+        out.extend(f"  - {scalar(v)}\n" for v in values)
+    else:
+        out.append(f"  {key}: {scalar(values)}\n")
+
+
 @dataclass
 class Task:
     """A task in the registry."""
@@ -41,6 +80,23 @@ class Task:
             depends_on=data.get("depends_on", []),
         )
 
+    def write_yaml(self, out: list[str]) -> None:
+        """Append this task as a gaston.yaml list item to out.
+
+        Mirrors to_dict(): optional fields are only written when set.
+        """
+        out.append(f"- id: {scalar(self.id)}\n")
+        out.append(f"  description: {scalar(self.description)}\n")
+        out.append(f"  status: {self.status.value}\n")
+        if self.claimed_by:
+            out.append(f"  claimed_by: {scalar(self.claimed_by)}\n")
+        if self.branch:
+            out.append(f"  branch: {scalar(self.branch)}\n")
+        if self.files:
+            _write_yaml_list(out, "files", self.files)
+        if self.depends_on:
+            _write_yaml_list(out, "depends_on", self.depends_on)
+
     def to_dict(self) -> dict:
         """Convert to a dictionary for YAML serialization."""
         d = {
@@ -64,52 +120,176 @@ class Registry:
     """The task registry."""
     goal: str
     tasks: list[Task]
+    _id_index: dict[str, Task] = field(init=False, repr=False, compare=False)
+    _by_status: dict[TaskStatus, list[Task]] = field(init=False, repr=False, compare=False)
+    _active_file_index: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._reindex()
 
     @classmethod
     def registry_path(cls, repo_root: Path) -> Path:
         """Get the path to gaston.yaml."""
         return repo_root / "gaston.yaml"
 
+    @classmethod
+    def cache_path(cls, repo_root: Path) -> Path:
+        """Get the path to the parsed-registry cache."""
+        return repo_root / ".gaston" / "registry.json"
+
     @classmethod
     def load(cls, repo_root: Path) -> "Registry":
         """Load the registry from gaston.yaml."""
         path = cls.registry_path(repo_root)
-        if not path.exists():
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"No gaston.yaml found at {path}. "
                 "Create one to define tasks for this project."
-            )
+            ) from None
 
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        with f:
+            key = cls._cache_key(os.fstat(f.fileno()))
+            data = cls._read_cache(repo_root, key)
+            if data is None:
+                # PyYAML is only imported on a cache miss
+                yaml_loader = loader()(f)
+                try:
+                    data = yaml_loader.get_single_data()
+                finally:
+                    yaml_loader.dispose()
+                cls._write_cache(repo_root, key, data)
 
         return cls(
             goal=data.get("goal", ""),
             tasks=[Task.from_dict(t) for t in data.get("tasks", [])],
         )
 
-    def save(self, repo_root: Path) -> None:
-        """Save the registry to gaston.yaml."""
+    def save(self, repo_root: Path) -> bool:
+        """Save the registry to gaston.yaml.
+
+        Returns False without touching the file if it already has this content.
+        """
         path = self.registry_path(repo_root)
 
+        # The schema is fixed, so emit the YAML text directly rather than
+        # walking the data with PyYAML's generic representer
+        out = [f"goal: {scalar(self.goal)}\n"]
+        if self.tasks:
+            out.append("tasks:\n")
+            for task in self.tasks:
+                task.write_yaml(out)
+        else:
+            out.append("tasks: []\n")
+        content = "".join(out).encode("utf-8")
+
+        self._reindex()
+        try:
+            if path.read_bytes() == content:
+                return False
+        except FileNotFoundError:
+            pass
+
+        atomic_write(path, content)
+
+        # to_dict() holds exactly the values write_yaml() emitted, so the
+        # cache agrees with what parsing the new file would give
         data = {
             "goal": self.goal,
             "tasks": [t.to_dict() for t in self.tasks],
         }
+        self._write_cache(repo_root, self._cache_key(path.stat()), data)
+        return True
+
+    def _reindex(self) -> None:
+        """Rebuild lookup structures derived from the task list."""
+        self._id_index = {}
+        self._by_status = {status: [] for status in TaskStatus}
+        for task in self.tasks:
+            self._id_index.setdefault(task.id, task)
+            self._by_status[task.status].append(task)
+        self._active_file_index = None
+
+    @staticmethod
+    def _cache_key(st: os.stat_result) -> tuple:
+        """Identify a version of gaston.yaml by its mtime and size."""
+        return (_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def _read_cache(cls, repo_root: Path, key: tuple) -> Optional[dict]:
+        """Return the cached registry data if it matches key, else None."""
+        try:
+            with open(cls.cache_path(repo_root), "rb") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            # Missing or truncated cache: just re-parse
+            return None
+
+        if not isinstance(cached, dict) or cached.get("key") != list(key):
+            return None
+        return cached.get("data")
+
+    @classmethod
+    def _write_cache(cls, repo_root: Path, key: tuple, data: dict) -> None:
+        """Write the registry data cache atomically. Failures are ignored."""
+        cache_path = cls.cache_path(repo_root)
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            # Keep the cache directory out of `git status`
+            ignore_path = cache_path.parent / ".gitignore"
+            if not ignore_path.exists():
+                ignore_path.write_text("*\n")
+
+            content = json.dumps({"key": list(key), "data": data}, separators=(",", ":"))
+            atomic_write(cache_path, content.encode("utf-8"))
+        except (OSError, TypeError, ValueError):
+            # TypeError/ValueError: YAML produced something JSON can't hold
+            pass
+
+    def add_task(self, task: Task) -> None:
+        """Append a task to the registry."""
+        self.tasks.append(task)
+        self._id_index.setdefault(task.id, task)
+        self._by_status[task.status].append(task)
+        if task.status in _ACTIVE_STATUSES:
+            self._active_file_index = None
 
-        with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    def set_status(self, task: Task, status: TaskStatus) -> None:
+        """Change a task's status, keeping the status buckets current."""
+        if task.status == status:
+            return
+        if task.status in _ACTIVE_STATUSES or status in _ACTIVE_STATUSES:
+            self._active_file_index = None
+        # Remove by identity: Task compares by value, and duplicates may exist
+        pos = self._bucket_position(task)
+        if pos is None:
+            # Buckets went stale (task.status assigned directly, or tasks
+            # appended without add_task); rebuild them once
+            self._reindex()
+            pos = self._bucket_position(task)
+            if pos is None:
+                raise ValueError(f"Task '{task.id}' is not in this registry")
+        del self._by_status[task.status][pos]
+        self._by_status[status].append(task)
+        task.status = status
+
+    def _bucket_position(self, task: Task) -> Optional[int]:
+        """Find task itself (not an equal copy) in its status bucket."""
+        for pos, other in enumerate(self._by_status[task.status]):
+            if other is task:
+                return pos
+        return None
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._id_index.get(task_id)
 
     def get_pending_tasks(self) -> list[Task]:
         """Get all pending tasks."""
-        return [t for t in self.tasks if t.status == TaskStatus.PENDING]
+        return list(self._by_status[TaskStatus.PENDING])
 
     def get_tasks_by_agent(self, agent_name: str) -> list[Task]:
         """Get all tasks claimed by an agent."""
@@ -117,7 +297,7 @@ class Registry:
 
     def get_tasks_in_review(self) -> list[Task]:
         """Get all tasks awaiting review."""
-        return [t for t in self.tasks if t.status == TaskStatus.REVIEW]
+        return list(self._by_status[TaskStatus.REVIEW])
 
     def check_dependencies(self, task: Task) -> list[str]:
         """Check if task dependencies are satisfied. Returns list of unmet deps."""
@@ -135,29 +315,52 @@ class Registry:
 
         Returns list of (conflicting_file, other_task) tuples.
         """
-        conflicts = []
-        active_statuses = {TaskStatus.CLAIMED, TaskStatus.IN_PROGRESS, TaskStatus.REVIEW}
+        index = self._file_index()
+        if not index:
+            return []
+        hits = []
 
-        for other in self.tasks:
-            if other.id == task.id:
-                continue
-            if other.status not in active_statuses:
-                continue
+        for file_pos, task_file in enumerate(task.files):
+            node = index
+            for part in _path_parts(task_file):
+                node = node.get(part)
+                if node is None:
+                    break
+                # Other paths equal to, or directories containing, task_file
+                hits.extend((pos, file_pos, other) for pos, other in node.get(_OWNERS, ()))
+            else:
+                # Other paths inside task_file
+                stack = [child for key, child in node.items() if key is not _OWNERS]
+                while stack:
+                    node = stack.pop()
+                    for key, child in node.items():
+                        if key is _OWNERS:
+                            hits.extend((pos, file_pos, other) for pos, other in child)
+                        else:
+                            stack.append(child)
 
-            # Check for file overlaps
-            for task_file in task.files:
-                for other_file in other.files:
-                    if self._paths_overlap(task_file, other_file):
-                        conflicts.append((task_file, other))
+        hits.sort(key=lambda hit: hit[:2])
+        return [
+            (task.files[file_pos], other)
+            for _, file_pos, other in hits
+            if other.id != task.id
+        ]
 
-        return conflicts
+    def _file_index(self) -> dict:
+        """Get the trie of files owned by active tasks, building it if needed.
 
-    @staticmethod
-    def _paths_overlap(path1: str, path2: str) -> bool:
-        """Check if two file paths might conflict."""
-        # Normalize trailing slashes
-        p1 = path1.rstrip("/")
-        p2 = path2.rstrip("/")
-
-        # Check if one is a prefix of the other (directory contains file)
-        return p1.startswith(p2) or p2.startswith(p1) or p1 == p2
+        Each node maps a path component to its child node; the _OWNERS key
+        holds (task_position, task) pairs for paths ending at that node.
+        """
+        if self._active_file_index is None:
+            root: dict = {}
+            for pos, other in enumerate(self.tasks):
+                if other.status not in _ACTIVE_STATUSES:
+                    continue
+                for other_file in other.files:
+                    node = root
+                    for part in _path_parts(other_file):
+                        node = node.setdefault(part, {})
+                    node.setdefault(_OWNERS, []).append((pos, other))
+            self._active_file_index = root
+        return self._active_file_index
@@ -0,0 +1,81 @@
+"""Minimal YAML scalar formatting for gaston's own files."""
+
+import functools
+import re
+
+# Strings that are safe to write unquoted: ASCII, starting with a letter,
+# underscore or slash, and free of YAML indicators such as ": " or " #".
+_PLAIN = re.compile(r"[A-Za-z_/][A-Za-z0-9_ ./(),'-]*")
+
+# Plain words a YAML 1.1 loader would read as booleans or null
+_RESERVED = frozenset({"yes", "no", "true", "false", "on", "off", "y", "n", "null"})
+
+
+@functools.lru_cache(maxsize=None)
+def loader() -> type:
+    """Get the fastest available PyYAML safe loader, importing PyYAML on first use.
+
+    Prefers libyaml's CSafeLoader, which also reads bytes without
+    Python-side decoding.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def quote(value: str) -> str:
+    """Render a string as a YAML double-quoted scalar."""
+    out = []
+    for ch in value:
+        if ch in '"\\':
+            out.append("\\" + ch)
+        elif ch.isprintable():
+            out.append(ch)
+        else:
+            code = ord(ch)
+            if code <= 0xFF:
+                out.append(f"\\x{code:02X}")
+            elif code <= 0xFFFF:
+                out.append(f"\\u{code:04X}")
+            else:
+                out.append(f"\\U{code:08X}")
+    return '"' + "".join(out) + '"'
+
+
+def scalar(value) -> str:
+    """Render a value as an inline YAML scalar, leaving strings unquoted when that's unambiguous.
+
+    Strings, None, booleans and integers are written directly. Anything else
+    the safe loader can produce (floats, dates, nested lists/mappings) goes
+    through PyYAML's safe dumper in flow style.
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if not isinstance(value, str):
+        return _dump_flow(value)
+    if (
+        _PLAIN.fullmatch(value)
+        and not value.endswith(" ")
+        and value.lower() not in _RESERVED
+    ):
+        return value
+    return quote(value)
+
+
+def _dump_flow(value) -> str:
+    """Render any safe-representable value on a single line with PyYAML."""
+    import yaml
+
+    text = yaml.dump(
+        value,
+        Dumper=yaml.SafeDumper,
+        default_flow_style=True,
+        allow_unicode=True,
+        width=2**31 - 1,
+    )
+    # Bare scalars get an explicit document end marker
+    return text.removesuffix("\n...\n").rstrip("\n")
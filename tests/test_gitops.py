@@ -0,0 +1,86 @@
+"""Tests for gaston.gitops."""
+
+import pytest
+
+from gaston.gitops import (
+    GitBatch,
+    GitError,
+    branch_exists,
+    commit_file,
+    create_branch,
+    get_default_branch,
+    run_git,
+)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    for var in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{var}_NAME", "test")
+        monkeypatch.setenv(f"GIT_{var}_EMAIL", "test@example.com")
+    run_git("init", "-q", "-b", "main", cwd=tmp_path)
+    run_git("commit", "-q", "--allow-empty", "-m", "init", cwd=tmp_path)
+    return tmp_path
+
+
+def test_commit_file_adds_untracked_file(repo):
+    (repo / "gaston.yaml").write_text("goal: g\n")
+    commit_file("gaston.yaml", "add registry", repo)
+
+    assert run_git("log", "-1", "--format=%s", cwd=repo) == "add registry"
+    assert run_git("status", "--porcelain", cwd=repo) == ""
+
+
+def test_commit_file_leaves_other_staged_changes(repo):
+    (repo / "gaston.yaml").write_text("goal: g\n")
+    commit_file("gaston.yaml", "add registry", repo)
+    (repo / "gaston.yaml").write_text("goal: h\n")
+    (repo / "other.txt").write_text("x\n")
+    run_git("add", "other.txt", cwd=repo)
+
+    commit_file("gaston.yaml", "update registry", repo)
+
+    assert run_git("show", "--name-only", "--format=", "HEAD", cwd=repo) == "gaston.yaml"
+    assert run_git("diff", "--cached", "--name-only", cwd=repo) == "other.txt"
+
+
+def test_commit_file_reports_hook_failure_once(repo):
+    (repo / "gaston.yaml").write_text("goal: g\n")
+    commit_file("gaston.yaml", "add registry", repo)
+    (repo / "gaston.yaml").write_text("goal: h\n")
+    hook = repo / ".git" / "hooks" / "pre-commit"
+    hook.write_text("#!/bin/sh\necho run >> .git/hook-runs\nexit 1\n")
+    hook.chmod(0o755)
+
+    with pytest.raises(GitError):
+        commit_file("gaston.yaml", "update registry", repo)
+
+    assert (repo / ".git" / "hook-runs").read_text() == "run\n"
+    assert run_git("diff", "--cached", "--name-only", cwd=repo) == ""
+
+
+def test_git_batch_resolves_refs(repo):
+    head = run_git("rev-parse", "HEAD", cwd=repo)
+    with GitBatch(repo) as batch:
+        assert batch.resolve("HEAD") == head
+        assert batch.resolve("main") == head
+        assert batch.resolve("no-such-branch") is None
+        assert batch.resolve("bad\nref") is None
+        assert branch_exists("main", repo)
+        assert not branch_exists("no-such-branch", repo)
+        assert get_default_branch(repo) == "main"
+
+
+def test_git_batch_sees_branches_created_inside_it(repo):
+    with GitBatch(repo):
+        assert not branch_exists("feature", repo)
+        create_branch("feature", repo)
+        assert branch_exists("feature", repo)
+
+
+def test_git_batch_is_inactive_after_exit(repo):
+    with GitBatch(repo) as batch:
+        batch.resolve("HEAD")
+    assert batch._proc is None
+    # Falls back to a one-off rev-parse
+    assert branch_exists("main", repo)
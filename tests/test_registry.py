@@ -0,0 +1,179 @@
+"""Tests for gaston.registry."""
+
+import pytest
+
+from gaston.registry import Registry, Task, TaskStatus
+
+
+def test_save_preserves_non_string_values(tmp_path):
+    (tmp_path / "gaston.yaml").write_text(
+        "goal: g\ntasks:\n- id: 123\n  description:\n  status: pending\n"
+    )
+    registry = Registry.load(tmp_path)
+    registry.add_task(Task(id="new", description="d"))
+    assert registry.save(tmp_path)
+
+    cached = Registry.load(tmp_path)
+    Registry.cache_path(tmp_path).unlink()
+    parsed = Registry.load(tmp_path)
+
+    assert cached == parsed
+    assert parsed.tasks[0].id == 123
+    assert parsed.tasks[0].description is None
+
+
+def test_save_without_changes_returns_false(tmp_path):
+    registry = Registry(goal="g", tasks=[Task(id="a", description="d")])
+    assert registry.save(tmp_path)
+    assert not Registry.load(tmp_path).save(tmp_path)
+
+
+def test_set_status_moves_the_given_task_among_equal_ones():
+    first = Task(id="a", description="d")
+    second = Task(id="a", description="d")
+    registry = Registry(goal="g", tasks=[first, second])
+
+    registry.set_status(second, TaskStatus.CLAIMED)
+
+    pending = registry.get_pending_tasks()
+    assert len(pending) == 1 and pending[0] is first
+    assert registry._by_status[TaskStatus.CLAIMED][0] is second
+
+
+def test_set_status_recovers_from_direct_assignment():
+    task = Task(id="a", description="d")
+    registry = Registry(goal="g", tasks=[task])
+    task.status = TaskStatus.CLAIMED
+
+    registry.set_status(task, TaskStatus.REVIEW)
+
+    assert registry.get_tasks_in_review() == [task]
+    assert registry.get_pending_tasks() == []
+
+
+def test_set_status_rejects_unknown_task():
+    registry = Registry(goal="g", tasks=[])
+    with pytest.raises(ValueError):
+        registry.set_status(Task(id="a", description="d"), TaskStatus.CLAIMED)
+
+
+def test_save_keeps_scalar_list_fields(tmp_path):
+    (tmp_path / "gaston.yaml").write_text(
+        "goal: g\ntasks:\n- id: a\n  description: d\n  status: pending\n"
+        "  files: src/\n  depends_on: encrypt-core\n"
+    )
+    registry = Registry.load(tmp_path)
+    registry.add_task(Task(id="new", description="d"))
+    assert registry.save(tmp_path)
+
+    Registry.cache_path(tmp_path).unlink()
+    task = Registry.load(tmp_path).tasks[0]
+    assert task.files == "src/"
+    assert task.depends_on == "encrypt-core"
+
+
+def test_save_keeps_dates_and_floats(tmp_path):
+    (tmp_path / "gaston.yaml").write_text(
+        "goal: g\ntasks:\n- id: 2024-01-01\n  description: 1.5\n  status: pending\n"
+    )
+    registry = Registry.load(tmp_path)
+    registry.add_task(Task(id="new", description="d"))
+    assert registry.save(tmp_path)
+
+    # JSON can't hold dates, so nothing is cached for this registry
+    Registry.cache_path(tmp_path).unlink(missing_ok=True)
+    assert Registry.load(tmp_path).tasks[0] == registry.tasks[0]
+
+
+def _conflict_registry():
+    tasks = [
+        Task(id="mine", description="d", files=["src/a", "docs/"]),
+        Task(id="dir", description="d", status=TaskStatus.CLAIMED, files=["src/"]),
+        Task(id="sibling", description="d", status=TaskStatus.IN_PROGRESS, files=["src/ab"]),
+        Task(id="inside", description="d", status=TaskStatus.REVIEW, files=["docs/guide.md", "src/a/x.py"]),
+        Task(id="done", description="d", status=TaskStatus.MERGED, files=["src/a"]),
+        Task(id="todo", description="d", files=["src/a"]),
+    ]
+    return Registry(goal="g", tasks=tasks)
+
+
+def test_file_conflicts_cover_containing_and_contained_paths():
+    registry = _conflict_registry()
+    mine = registry.get_task("mine")
+
+    conflicts = [(path, other.id) for path, other in registry.check_file_conflicts(mine)]
+
+    # Ordered by other task, then by the task's own file; "src/ab" is a
+    # sibling of "src/a", merged and pending tasks don't own files, and the
+    # task never conflicts with itself
+    assert conflicts == [
+        ("src/a", "dir"),
+        ("src/a", "inside"),
+        ("docs/", "inside"),
+    ]
+
+
+def test_file_conflicts_match_equal_paths_ignoring_trailing_slash():
+    registry = _conflict_registry()
+    task = Task(id="new", description="d", files=["src/ab/"])
+    registry.add_task(task)
+
+    conflicts = [(path, other.id) for path, other in registry.check_file_conflicts(task)]
+
+    assert conflicts == [("src/ab/", "dir"), ("src/ab/", "sibling")]
+
+
+def test_file_conflicts_follow_status_changes():
+    registry = _conflict_registry()
+    mine = registry.get_task("mine")
+    registry.check_file_conflicts(mine)
+
+    registry.set_status(registry.get_task("dir"), TaskStatus.MERGED)
+    registry.set_status(registry.get_task("todo"), TaskStatus.CLAIMED)
+
+    conflicts = [(path, other.id) for path, other in registry.check_file_conflicts(mine)]
+    assert conflicts == [("src/a", "inside"), ("docs/", "inside"), ("src/a", "todo")]
+
+
+REGISTRY_YAML = "goal: g\ntasks:\n- id: a\n  description: d\n  status: pending\n"
+
+
+def _fail_parse():
+    raise AssertionError("gaston.yaml should have been served from the cache")
+
+
+def test_load_is_served_from_cache(tmp_path, monkeypatch):
+    (tmp_path / "gaston.yaml").write_text(REGISTRY_YAML)
+    first = Registry.load(tmp_path)
+    assert (tmp_path / ".gaston" / ".gitignore").read_text() == "*\n"
+
+    monkeypatch.setattr("gaston.registry.loader", _fail_parse)
+    assert Registry.load(tmp_path) == first
+
+
+def test_cache_is_ignored_after_file_changes(tmp_path):
+    path = tmp_path / "gaston.yaml"
+    path.write_text(REGISTRY_YAML)
+    Registry.load(tmp_path)
+
+    path.write_text(REGISTRY_YAML.replace("id: a", "id: bb"))
+
+    assert Registry.load(tmp_path).tasks[0].id == "bb"
+
+
+def test_corrupt_cache_falls_back_to_yaml(tmp_path):
+    (tmp_path / "gaston.yaml").write_text(REGISTRY_YAML)
+    Registry.load(tmp_path)
+    Registry.cache_path(tmp_path).write_text("{not json")
+
+    assert Registry.load(tmp_path).tasks[0].id == "a"
+
+
+def test_save_refreshes_cache(tmp_path, monkeypatch):
+    registry = Registry(goal="g", tasks=[Task(id="a", description="d")])
+    registry.save(tmp_path)
+    registry.set_status(registry.tasks[0], TaskStatus.CLAIMED)
+    registry.save(tmp_path)
+
+    monkeypatch.setattr("gaston.registry.loader", _fail_parse)
+    assert Registry.load(tmp_path).tasks[0].status == TaskStatus.CLAIMED
@@ -0,0 +1,79 @@
+"""Tests for gaston.yamlutil."""
+
+import datetime
+
+import pytest
+import yaml
+
+from gaston.yamlutil import scalar
+
+
+def _round_trip(value):
+    return yaml.safe_load(f"key: {scalar(value)}\n")["key"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "alpha",
+        "pkg/crypto/",
+        "Implement AES encryption/decryption functions",
+        "",
+        "  ",
+        " lead",
+        "trail ",
+        "yes",
+        "No",
+        "null",
+        "~",
+        "123",
+        "1.5",
+        ".inf",
+        "2024-01-01",
+        "0x1F",
+        "- x",
+        "a: b",
+        "a #b",
+        "'q'",
+        '"q"',
+        "back\\slash",
+        "line\nbreak",
+        "tab\there",
+        "\x00\x85 ﻿",
+        "日本",
+        "🎉",
+    ],
+)
+def test_strings_round_trip(value):
+    assert _round_trip(value) == value
+
+
+@pytest.mark.parametrize("value", [None, True, False, 0, 123, -7])
+def test_non_strings_round_trip(value):
+    result = _round_trip(value)
+    assert result == value
+    assert type(result) is type(value)
+
+
+def test_simple_strings_are_plain():
+    assert scalar("agent/alpha/encrypt-core") == "agent/alpha/encrypt-core"
+    assert scalar("yes") == '"yes"'
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        1.5,
+        -0.25,
+        1e20,
+        float("inf"),
+        datetime.date(2024, 1, 1),
+        datetime.datetime(2024, 1, 1, 12, 30),
+        ["a", 1, None],
+        {"a": 1, "b": ["x y"]},
+        [],
+    ],
+)
+def test_other_safe_values_round_trip(value):
+    assert _round_trip(value) == value
+    assert "\n" not in scalar(value)